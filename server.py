@@ -1,6 +1,9 @@
 from fastmcp import FastMCP
 
-from tools.extract_pricing_requirements import extract_pricing_requirements
+from tools.extract_pricing_requirements import (
+    extract_pricing_requirements,
+    extract_pricing_requirements_multi,
+)
 from tools.build_pricing_model import build_pricing_model
 from tools.calculate_prices import calculate_prices
 from tools.generate_html_report import generate_html_report
@@ -34,6 +37,30 @@ def detect_pricing_requirements(file_path: str) -> dict:
     return extract_pricing_requirements(file_path)
 
 
+@mcp.tool
+def detect_pricing_requirements_multi(file_paths: list[str]) -> dict:
+    """
+    Detect pricing requirements across several documents of one tender pack.
+
+    Parameters
+    ----------
+    file_paths: list[str]
+        Paths to local tender documents (PDF, DOCX, XLSX).
+
+    Returns
+    -------
+    dict
+        {
+          "instructions": "...",
+          "summary": "...",
+          "currency": "ZAR",
+          "pricing_items": [...merged and deduplicated across documents...],
+          "documents": [{"file_path": ..., "document_type": ..., "raw_text": ...}]
+        }
+    """
+    return extract_pricing_requirements_multi(file_paths)
+
+
 @mcp.tool
 def build_model(description: str, tender_rules: str, company_rates: str) -> dict:
     """
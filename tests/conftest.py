@@ -0,0 +1,5 @@
+import sys
+from pathlib import Path
+
+# The tools/utils modules are imported from the repo root, as server.py does.
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
@@ -0,0 +1,129 @@
+from utils.pricing_items import (
+    MAX_EXCERPT_LINES,
+    collect_pricing_items,
+    guess_quantity_unit,
+    keyword_snippets,
+    merge_pricing_items,
+    normalise_description,
+)
+
+
+def test_keyword_snippets_merges_overlapping_windows():
+    lines = [f"line {i}" for i in range(30)]
+    lines[5] = "Pricing schedule"
+    lines[8] = "BOQ"
+
+    snippets = keyword_snippets(lines, ["pricing schedule", "boq"])
+
+    assert len(snippets) == 1
+    assert snippets[0].splitlines() == lines[2:18]
+
+
+def test_keyword_snippets_keeps_distant_windows_separate():
+    lines = [f"line {i}" for i in range(60)]
+    lines[5] = "BOQ"
+    lines[40] = "BOQ"
+
+    snippets = keyword_snippets(lines, ["boq"])
+
+    assert [s.splitlines()[0] for s in snippets] == ["line 2", "line 37"]
+
+
+def test_keyword_snippets_respects_window_and_total_budget():
+    lines = [f"BOQ row {i}" if i % 10 == 0 else f"row {i}" for i in range(2000)]
+
+    snippets = keyword_snippets(lines, ["boq"], max_window_lines=40)
+    emitted = [ln for s in snippets for ln in s.splitlines()]
+
+    assert len(emitted) == MAX_EXCERPT_LINES
+    assert len(emitted) == len(set(emitted))
+    assert all(len(s.splitlines()) <= 40 for s in snippets)
+
+
+def test_normalise_description_ignores_case_punctuation_and_spacing():
+    assert normalise_description("Item 1:  Security Guard, Grade C.") == normalise_description(
+        "item 1 security guard grade c"
+    )
+    assert normalise_description("Guard 12 hours") != normalise_description("Guard 24 hours")
+
+
+def test_guess_quantity_unit():
+    assert guess_quantity_unit("Security guard Grade C 720 hrs per month") == (720.0, "hour")
+    assert guess_quantity_unit("Patrol vehicle 1,200 km per month") == (1200.0, "km")
+    assert guess_quantity_unit("Qty: 4 armed response call-outs per site") == (4.0, None)
+    assert guess_quantity_unit("Quantity = 6 guards, 2 sites") == (6.0, "guard")
+    assert guess_quantity_unit("Supply as per drawing 7") == (None, None)
+
+
+def test_guess_quantity_unit_label_with_noun_phrase():
+    assert guess_quantity_unit("No. of guards: 6") == (6.0, None)
+    assert guess_quantity_unit("Number of guards 12") == (12.0, None)
+    assert guess_quantity_unit("Number of patrol vehicles = 2 units") == (2.0, "unit")
+    assert guess_quantity_unit("no. of 3 sites") == (3.0, "site")
+
+
+def test_guess_quantity_unit_label_ignores_unrelated_unit():
+    assert guess_quantity_unit("Guard 12 hours, qty: 3") == (3.0, None)
+    assert guess_quantity_unit("Guard 12 hours, qty: 3 shifts") == (3.0, "shift")
+
+
+def test_guess_quantity_unit_skips_years_and_references():
+    assert guess_quantity_unit("Some line with 2024 year text") == (None, None)
+    assert guess_quantity_unit("Section 3.2 hours of work") == (None, None)
+    assert guess_quantity_unit("Contract period 3 years from 2024") == (3.0, "year")
+    assert guess_quantity_unit("Clause 4 applies, 12 hours per shift") == (12.0, "hour")
+
+
+def test_collect_pricing_items_dedups_and_counts():
+    items = collect_pricing_items(
+        [
+            "Item 1 Security guard Grade C 720 hours",
+            "short 1",
+            "item 1 security  guard grade C 720 hours.",
+            "No digits on this particular line at all",
+        ]
+    )
+
+    assert len(items) == 1
+    assert items[0]["occurrences"] == 2
+    assert items[0]["raw_line"] == "Item 1 Security guard Grade C 720 hours"
+
+
+def test_collect_pricing_items_ranking():
+    items = collect_pricing_items(
+        [
+            "Tender reference 2024 year text",
+            "Patrol vehicle rental 30 days",
+            "Qty: 4 armed response call-outs",
+        ]
+    )
+
+    assert [it["raw_line"] for it in items] == [
+        "Qty: 4 armed response call-outs",
+        "Patrol vehicle rental 30 days",
+        "Tender reference 2024 year text",
+    ]
+
+
+def test_merge_pricing_items_across_documents():
+    first = collect_pricing_items(["Patrol  vehicle rental 30 days", "Guard services for 12 months"])
+    second = [
+        {"raw_line": "patrol vehicle rental 30 days", "occurrences": 2, "source": "boq.xlsx"},
+        {"raw_line": "Fuel allowance 500 litres", "quantity_guess": None},
+    ]
+
+    merged = merge_pricing_items(first, second)
+    by_line = {it["raw_line"]: it for it in merged}
+
+    assert len(merged) == 3
+    assert by_line["Patrol vehicle rental 30 days"]["occurrences"] == 3
+    fuel = by_line["Fuel allowance 500 litres"]
+    assert (fuel["quantity_guess"], fuel["unit_guess"]) == (500.0, "litre")
+
+
+def test_merge_pricing_items_keeps_normalised_text():
+    merged = merge_pricing_items([{"raw_line": "Guard   services  12 months", "extra": 1}])
+
+    assert merged[0]["raw_line"] == "Guard services 12 months"
+    assert merged[0]["description_guess"] == "Guard services 12 months"
+    assert merged[0]["extra"] == 1
@@ -0,0 +1,208 @@
+import json
+from pathlib import Path
+
+import pytest
+
+from tools.build_pricing_model import build_pricing_model
+from tools.calculate_prices import calculate_prices
+from utils.pricing_rules import apply_pricing_rules, compile_pricing_rules
+
+SAMPLE = Path(__file__).resolve().parents[1] / "resources" / "sample_data" / "example_pricing.json"
+
+
+def _run(rules, item, value=100.0):
+    compiled = compile_pricing_rules(rules)
+    applied = []
+    value = apply_pricing_rules(compiled["base"], item, value, applied)
+    value = apply_pricing_rules(compiled["rate"], item, value, applied)
+    return value, applied
+
+
+def test_compile_splits_rules_into_stages():
+    compiled = compile_pricing_rules(
+        [
+            {"type": "rounding", "step": 1},
+            {"type": "escalation", "percent": 10},
+            {"type": "discount", "percent": 5, "stage": "base"},
+            {"type": "min_rate", "value": 50},
+        ]
+    )
+
+    assert [label for label, _, _ in compiled["base"]] == ["escalation", "discount", "min_rate"]
+    assert [label for label, _, _ in compiled["rate"]] == ["rounding"]
+
+
+def test_escalation_compounds_over_years():
+    value, applied = _run([{"type": "escalation", "percent": 10, "years": 2}], {})
+
+    assert value == pytest.approx(121.0)
+    assert applied == ["escalation"]
+
+
+@pytest.mark.parametrize(
+    "mode, step, value, expected",
+    [
+        ("nearest", 5, 101.0, 100.0),
+        ("up", 5, 101.0, 105.0),
+        ("down", 5, 101.0, 100.0),
+        ("nearest", 5, 12.5, 15.0),
+        ("nearest", 0.5, 1.25, 1.5),
+        ("nearest", 10, 25.0, 30.0),
+        ("up", 0.1, 0.3, 0.3),
+        ("down", 0.1, 0.7, 0.7),
+        ("nearest", 0.05, 1.024, 1.0),
+    ],
+)
+def test_rounding_modes(mode, step, value, expected):
+    result, _ = _run([{"type": "rounding", "step": step, "mode": mode}], {}, value=value)
+
+    # Exact comparison: ties round half‑up and results carry no float noise.
+    assert result == expected
+
+
+def test_filters_match_category_unit_and_keyword():
+    rules = [
+        {"type": "discount", "percent": 10, "category": "Equipment"},
+        {"type": "max_rate", "value": 80, "unit": "hour", "match": "night"},
+    ]
+
+    assert _run(rules, {"category": "equipment", "unit": "day"})[0] == pytest.approx(90.0)
+    assert _run(rules, {"category": "guarding", "unit": "hour", "description": "Night guard"})[
+        0
+    ] == pytest.approx(80.0)
+    assert _run(rules, {"category": "guarding", "unit": "hour", "description": "Day guard"})[
+        0
+    ] == pytest.approx(100.0)
+
+
+@pytest.mark.parametrize(
+    "rule",
+    [
+        {"type": "rounding", "step": -5, "mode": "up"},
+        {"type": "rounding", "step": 0},
+        {"type": "rounding", "step": 1, "mode": "sideways"},
+        {"type": "discount", "percent": 150},
+        {"type": "discount", "percent": -5},
+        {"type": "discount", "percent": "nan"},
+        {"type": "escalation", "percent": "inf"},
+        {"type": "escalation", "percent": 5, "years": "soon"},
+        {"type": "min_rate", "value": -1},
+        {"type": "max_rate"},
+        {"type": "bogus", "percent": 5},
+        {"type": "discount", "percent": 5, "stage": "later"},
+        {"type": ["discount"], "percent": 5},
+        {"type": "discout", "percent": 5},
+        "not a rule",
+    ],
+)
+def test_invalid_rules_are_skipped_and_reported(rule):
+    skipped = []
+    compiled = compile_pricing_rules([rule], skipped)
+
+    assert compiled == {"base": [], "rate": []}
+    assert len(skipped) == 1
+    assert skipped[0]["rule"] == rule
+    assert skipped[0]["reason"]
+
+
+def test_single_rule_dict_is_accepted():
+    compiled = compile_pricing_rules({"type": "discount", "percent": 10})
+
+    assert [label for label, _, _ in compiled["rate"]] == ["discount"]
+
+
+@pytest.mark.parametrize("rules", [5, "discount 10%"])
+def test_non_list_rules_are_treated_as_empty(rules):
+    skipped = []
+    compiled = compile_pricing_rules(rules, skipped)
+
+    assert compiled == {"base": [], "rate": []}
+    assert skipped == [{"rule": rules, "reason": "pricing_rules must be a list of rule objects"}]
+
+
+def test_calculate_reports_skipped_rules():
+    model = {
+        "meta": {
+            "vat_percent": 0,
+            "pricing_rules": [
+                {"type": "discout", "percent": 10},
+                {"type": "discount", "percent": 150},
+                {"type": "escalation", "percent": 10},
+            ],
+        },
+        "items": [{"description": "Guard", "quantity": 1, "base_rate": 100, "markup_percent": 0}],
+    }
+
+    result = calculate_prices(model)
+
+    assert result["items"][0]["rate_with_markup"] == 110.0
+    assert [s["rule"]["type"] for s in result["rules_skipped"]] == ["discout", "discount"]
+    assert "rules_skipped" in result["instructions"]
+
+
+def test_calculate_without_rules_is_unchanged():
+    model = json.loads(SAMPLE.read_text(encoding="utf-8"))
+
+    result = calculate_prices(model)
+
+    assert result["totals"]["total_ex_vat"] == 175000.0
+    assert all("rules_applied" not in it and "adjusted_base_rate" not in it for it in result["items"])
+    assert "rules_skipped" not in result
+
+
+def test_calculate_applies_stages_and_keeps_base_rate():
+    model = {
+        "meta": {
+            "vat_percent": 15.0,
+            "pricing_rules": [
+                {"type": "rounding", "step": 10, "mode": "up"},
+                {"type": "escalation", "percent": 10},
+            ],
+        },
+        "items": [{"description": "Guard", "quantity": 2, "base_rate": 100, "markup_percent": 25}],
+    }
+
+    line = calculate_prices(model)["items"][0]
+
+    # 100 -> 110 (escalation) -> 137.5 (markup) -> 140 (rounding up)
+    assert line["base_rate"] == 100
+    assert line["adjusted_base_rate"] == 110.0
+    assert line["rate_with_markup"] == 140.0
+    assert line["line_total_ex_vat"] == 280.0
+    assert line["rules_applied"] == ["escalation", "rounding"]
+
+
+def test_recalculating_a_result_does_not_reapply_rules():
+    model = {
+        "meta": {"vat_percent": 0, "pricing_rules": [{"type": "escalation", "percent": 10}]},
+        "items": [{"description": "Guard", "quantity": 1, "base_rate": 100, "markup_percent": 0}],
+    }
+
+    first = calculate_prices(model)
+    second = calculate_prices({"meta": first["meta"], "items": first["items"]})
+
+    assert first["items"][0]["rate_with_markup"] == 110.0
+    assert second["items"][0]["rate_with_markup"] == 110.0
+    assert second["items"][0]["base_rate"] == 100
+
+    # Dropping the rules must also drop the stale rule output on the items.
+    third = calculate_prices({"meta": {"vat_percent": 0}, "items": second["items"]})
+
+    assert third["items"][0]["rate_with_markup"] == 100.0
+    assert "adjusted_base_rate" not in third["items"][0]
+    assert "rules_applied" not in third["items"][0]
+
+
+def test_build_model_seeds_category_for_rule_filters():
+    built = build_pricing_model(
+        "Guarding", "", "Guard Grade C, 20, hour, 720, Guarding\nRadio, 5, month"
+    )["model"]
+
+    assert [it["category"] for it in built["items"]] == ["guarding", "general"]
+    assert built["meta"]["pricing_rules"] == []
+
+    built["meta"]["pricing_rules"] = [{"type": "discount", "percent": 50, "category": "guarding"}]
+    lines = calculate_prices(built)["items"]
+
+    assert lines[0]["rate_with_markup"] == 12.5
+    assert lines[1]["rate_with_markup"] == 6.25
@@ -6,10 +6,10 @@ def _parse_company_rates(company_rates: str) -> List[dict]:
     Parse simplistic CSV‑style lines from the company rate sheet.
 
     Expected loose format per line (very forgiving):
-        description, unit_cost, unit, default_quantity
+        description, unit_cost, unit, default_quantity, category
 
     Example:
-        Security Guard Grade C, 22.50, hour, 720
+        Security Guard Grade C, 22.50, hour, 720, guarding
     """
     items = []
     for raw_line in company_rates.splitlines():
@@ -33,6 +33,8 @@ def _parse_company_rates(company_rates: str) -> List[dict]:
         except ValueError:
             default_qty = 1.0
 
+        category = parts[4].lower() if len(parts) > 4 and parts[4] else "general"
+
         items.append(
             {
                 "description": description,
@@ -40,6 +42,7 @@ def _parse_company_rates(company_rates: str) -> List[dict]:
                 "quantity": default_qty,
                 "base_rate": unit_cost,
                 "markup_percent": 25.0,
+                "category": category,
             }
         )
     return items
@@ -59,6 +62,7 @@ def build_pricing_model(description: str, tender_rules: str, company_rates: str)
         "meta": {
             "description": description.strip() or "Tender pricing model",
             "tender_rules": tender_rules.strip(),
+            "pricing_rules": [],
             "currency": "ZAR",
             "vat_percent": 15.0,
             "default_markup_percent": 25.0,
@@ -75,7 +79,22 @@ def build_pricing_model(description: str, tender_rules: str, company_rates: str)
         "instructions": (
             "You now have a structured pricing model under the 'model' key. "
             "You may modify 'items' (quantities, markups, descriptions) as needed "
-            "and then send the updated 'model' value directly into the `calculate` tool."
+            "and then send the updated 'model' value directly into the `calculate` tool. "
+            "Express tender‑specific adjustments from 'meta.tender_rules' as entries in "
+            "'meta.pricing_rules' instead of editing every item by hand. Each rule has "
+            "a 'type': escalation ('percent', optional 'years'), min_rate ('value'), "
+            "discount ('percent' 0–100), max_rate ('value') or rounding ('step' > 0, "
+            "'mode' nearest/up/down), and may be limited with 'category', 'unit' or "
+            "'match' (description keyword). Every item has a 'category' (default "
+            "'general'); set it to what the rules target. Rules run in two stages: "
+            "'base' rules change the cost rate before markup, then 'rate' rules change "
+            "the marked‑up rate. escalation and min_rate default to 'base'; discount, "
+            "max_rate and rounding default to 'rate'. Add \"stage\": \"base\" or "
+            "\"rate\" to override, e.g. a discount on cost. List order is kept only "
+            "within a stage. 'base_rate' is never changed by the rules; the result "
+            "shows 'adjusted_base_rate' and 'rules_applied' instead. Invalid rules "
+            "are not applied and are reported with a reason under 'rules_skipped' "
+            "in the `calculate` result."
         ),
         "model": model,
     }
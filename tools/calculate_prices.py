@@ -1,12 +1,24 @@
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Optional
 
+from utils.pricing_rules import CompiledRule, apply_pricing_rules, compile_pricing_rules
 
-def _calc_line(item: dict, vat_percent: float) -> dict:
+
+def _calc_line(
+    item: dict, vat_percent: float, rules: Optional[Dict[str, List[CompiledRule]]] = None
+) -> dict:
     qty = float(item.get("quantity", 0) or 0)
     base_rate = float(item.get("base_rate", 0) or 0)
     markup = float(item.get("markup_percent", 0) or 0)
 
-    rate_with_markup = base_rate * (1 + markup / 100.0)
+    applied: List[str] = []
+    adjusted_base = base_rate
+    if rules:
+        adjusted_base = apply_pricing_rules(rules["base"], item, base_rate, applied)
+
+    rate_with_markup = adjusted_base * (1 + markup / 100.0)
+    if rules:
+        rate_with_markup = apply_pricing_rules(rules["rate"], item, rate_with_markup, applied)
+
     line_ex_vat = qty * rate_with_markup
     vat_amount = line_ex_vat * (vat_percent / 100.0)
     line_inc_vat = line_ex_vat + vat_amount
@@ -20,6 +32,14 @@ def _calc_line(item: dict, vat_percent: float) -> dict:
             "line_total_inc_vat": round(line_inc_vat, 2),
         }
     )
+    # Drop rule output carried over from a previous calculation.
+    out.pop("adjusted_base_rate", None)
+    out.pop("rules_applied", None)
+    if applied:
+        # base_rate stays as supplied so re‑calculating a result does not
+        # apply the rules twice.
+        out["adjusted_base_rate"] = round(adjusted_base, 2)
+        out["rules_applied"] = applied
     return out
 
 
@@ -30,6 +50,8 @@ def calculate_prices(model_json: Dict[str, Any]) -> Dict[str, Any]:
     meta = model.get("meta", {})
     items: List[dict] = list(model.get("items", []))
     vat_percent = float(meta.get("vat_percent", 15.0) or 0)
+    rules_skipped: List[dict] = []
+    rules = compile_pricing_rules(meta.get("pricing_rules", []), rules_skipped)
 
     calc_items: List[dict] = []
     total_ex_vat = 0.0
@@ -37,7 +59,7 @@ def calculate_prices(model_json: Dict[str, Any]) -> Dict[str, Any]:
     total_inc_vat = 0.0
 
     for item in items:
-        line = _calc_line(item, vat_percent)
+        line = _calc_line(item, vat_percent, rules)
         calc_items.append(line)
         total_ex_vat += line["line_total_ex_vat"]
         total_vat += line["line_vat_amount"]
@@ -51,7 +73,7 @@ def calculate_prices(model_json: Dict[str, Any]) -> Dict[str, Any]:
         "vat_percent": vat_percent,
     }
 
-    return {
+    result: Dict[str, Any] = {
         "instructions": (
             "This is a fully calculated pricing result. Present line items and totals "
             "neatly to the user. Emphasise that all pricing is indicative and must be "
@@ -62,3 +84,11 @@ def calculate_prices(model_json: Dict[str, Any]) -> Dict[str, Any]:
         "items": calc_items,
         "totals": totals,
     }
+    if rules_skipped:
+        result["rules_skipped"] = rules_skipped
+        result["instructions"] += (
+            " Some entries in 'meta.pricing_rules' were invalid and NOT applied; "
+            "see 'rules_skipped' for each rule and the reason. Fix them and "
+            "calculate again before presenting these prices."
+        )
+    return result
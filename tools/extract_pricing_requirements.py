@@ -6,6 +6,12 @@ from utils.docx_reader import read_docx_text
 from utils.xlsx_reader import read_xlsx_text
 from utils.clean_text import clean_text
 from utils.classify_document import classify_document_type
+from utils.pricing_items import (
+    MAX_EXCERPT_LINES,
+    collect_pricing_items,
+    keyword_snippets,
+    merge_pricing_items,
+)
 
 
 KEYWORDS = [
@@ -39,13 +45,7 @@ def _read_any(file_path: str) -> str:
 
 def _extract_pricing_snippets(text: str) -> List[str]:
     lines = [ln.strip() for ln in text.splitlines() if ln.strip()]
-    snippets = []
-    for i, line in enumerate(lines):
-        lower = line.lower()
-        if any(k in lower for k in KEYWORDS):
-            window = lines[max(0, i - 3) : min(len(lines), i + 10)]
-            snippets.append("\n".join(window))
-    return snippets
+    return keyword_snippets(lines, KEYWORDS)
 
 
 def extract_pricing_requirements(file_path: str) -> Dict[str, Any]:
@@ -55,20 +55,14 @@ def extract_pricing_requirements(file_path: str) -> Dict[str, Any]:
     doc_type = classify_document_type(cleaned)
 
     snippets = _extract_pricing_snippets(cleaned)
-    excerpt = "\n\n".join(snippets[:5]) if snippets else cleaned[:4000]
-
-    pricing_items = []
-    # Very light heuristic: look for lines that look like an item + number
-    for line in excerpt.splitlines():
-        if any(ch.isdigit() for ch in line) and len(line) > 20:
-            pricing_items.append(
-                {
-                    "raw_line": line.strip(),
-                    "description_guess": line.strip()[:120],
-                    "quantity_guess": None,
-                    "unit_guess": None,
-                }
-            )
+    if snippets:
+        excerpt = "\n\n".join(snippets)
+    else:
+        excerpt = "\n".join(cleaned.splitlines()[:MAX_EXCERPT_LINES])[:4000]
+
+    # Very light heuristic: lines that look like an item + number, deduplicated
+    # and ranked so repeated rows are only sent to the LLM once.
+    pricing_items = collect_pricing_items(excerpt.splitlines())
 
     result: Dict[str, Any] = {
         "instructions": (
@@ -87,3 +81,32 @@ def extract_pricing_requirements(file_path: str) -> Dict[str, Any]:
         "document_type": doc_type,
     }
     return result
+
+
+def extract_pricing_requirements_multi(file_paths: List[str]) -> Dict[str, Any]:
+    """Core logic for `detect_pricing_requirements_multi` MCP tool."""
+    results = [extract_pricing_requirements(fp) for fp in file_paths]
+    pricing_items = merge_pricing_items(*(r["pricing_items"] for r in results))
+
+    return {
+        "instructions": (
+            "You are a tender pricing assistant. Several documents from the same "
+            "tender pack were scanned and their 'pricing_items' merged; lines that "
+            "repeat across documents appear once with a combined 'occurrences' "
+            "count. Use them as a rough starting point only and check each "
+            "document's 'raw_text' under 'documents' before pricing."
+        ),
+        "summary": f"{len(results)} documents scanned with "
+        f"{len(pricing_items)} distinct pricing‑related lines detected.",
+        "currency": "ZAR",
+        "pricing_items": pricing_items,
+        "documents": [
+            {
+                "file_path": r["file_path"],
+                "document_type": r["document_type"],
+                "summary": r["summary"],
+                "raw_text": r["raw_text"],
+            }
+            for r in results
+        ],
+    }
@@ -0,0 +1,252 @@
+import re
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+
+# Snippet windows: lines kept before/after a keyword hit, the longest span a
+# run of merged windows may grow to, and the total excerpt budget
+# (the old 5 windows x 13 lines).
+WINDOW_BEFORE = 3
+WINDOW_AFTER = 10
+MAX_WINDOW_LINES = 40
+MAX_EXCERPT_LINES = 65
+
+# Compiled once at import; these run over every candidate line.
+_NON_WORD_RE = re.compile(r"[^a-z0-9]+")
+_WS_RE = re.compile(r"\s+")
+_NUMBER = r"\d{1,3}(?:[ ,]\d{3})+(?:\.\d+)?|\d+(?:\.\d+)?"
+_REFERENCE_PREFIX_RE = re.compile(
+    r"\b(?:section|clause|paragraph|para|item|annex|annexure|schedule|page)\s*$",
+    re.IGNORECASE,
+)
+_UNITS = (
+    r"hours?|hrs?|days?|weeks?|months?|years?|guards?|shifts?|"
+    r"m2|m3|km|kg|tons?|tonnes?|litres?|liters?|units?|each|ea|items?|sets?|lots?|"
+    r"sites?|posts?|visits?"
+)
+_QTY_UNIT_RE = re.compile(
+    rf"(?<![\w.,])(?P<qty>{_NUMBER})\s*(?:x\s*)?(?P<unit>{_UNITS})(?!\w)",
+    re.IGNORECASE,
+)
+# "qty: 3", "Quantity = 6 guards", "No. of guards: 6", "Number of guards 12";
+# the unit only counts when it directly follows the labelled number.
+_QTY_LABEL_RE = re.compile(
+    r"\b(?:qty|quantity|(?:no\.|number) of(?:\s+[a-z][a-z ]{0,29}?)?)\s*[:=]?\s*"
+    rf"(?P<qty>{_NUMBER})(?:\s*(?P<unit>{_UNITS})(?!\w))?",
+    re.IGNORECASE,
+)
+
+_UNIT_ALIASES = {
+    "hr": "hour",
+    "hrs": "hour",
+    "hours": "hour",
+    "days": "day",
+    "weeks": "week",
+    "months": "month",
+    "years": "year",
+    "guards": "guard",
+    "shifts": "shift",
+    "tons": "ton",
+    "tonnes": "ton",
+    "tonne": "ton",
+    "litres": "litre",
+    "liter": "litre",
+    "liters": "litre",
+    "units": "unit",
+    "ea": "each",
+    "items": "item",
+    "sets": "set",
+    "lots": "lot",
+    "sites": "site",
+    "posts": "post",
+    "visits": "visit",
+}
+
+
+def keyword_snippets(
+    lines: Sequence[str],
+    keywords: Iterable[str],
+    max_window_lines: int = MAX_WINDOW_LINES,
+    max_lines: int = MAX_EXCERPT_LINES,
+) -> List[str]:
+    """
+    Return text windows around lines containing any of ``keywords``.
+
+    Overlapping windows are merged so no line is emitted twice, but a merged
+    window never grows past ``max_window_lines``; once it would, the next
+    window starts where the previous one ended. The total number of lines
+    across all snippets is capped at ``max_lines``.
+    """
+    keywords = [k.lower() for k in keywords]
+    windows: List[List[int]] = []
+    for i, line in enumerate(lines):
+        lower = line.lower()
+        if not any(k in lower for k in keywords):
+            continue
+
+        start, end = max(0, i - WINDOW_BEFORE), min(len(lines), i + WINDOW_AFTER)
+        if windows and start <= windows[-1][1]:
+            prev = windows[-1]
+            if end - prev[0] <= max_window_lines:
+                prev[1] = max(prev[1], end)
+                continue
+            start = prev[1]
+            if start >= end:
+                continue
+        windows.append([start, end])
+
+    snippets: List[str] = []
+    budget = max_lines
+    for start, end in windows:
+        if budget <= 0:
+            break
+        end = min(end, start + budget)
+        snippets.append("\n".join(lines[start:end]))
+        budget -= end - start
+    return snippets
+
+
+def normalise_description(line: str) -> str:
+    """Return the dedup key for a pricing line (case/punctuation insensitive)."""
+    return _NON_WORD_RE.sub(" ", line.lower()).strip()
+
+
+def _to_float(raw: str) -> Optional[float]:
+    try:
+        return float(raw.replace(",", "").replace(" ", ""))
+    except ValueError:
+        return None
+
+
+def _guess(line: str) -> Tuple[Optional[float], Optional[str], bool]:
+    quantity: Optional[float] = None
+    unit: Optional[str] = None
+
+    for match in _QTY_UNIT_RE.finditer(line):
+        raw_qty = match.group("qty")
+        raw_unit = match.group("unit").lower()
+        unit_name = _UNIT_ALIASES.get(raw_unit, raw_unit)
+        # "2024 year" is a date, "Section 3.2 hours" a reference number.
+        if unit_name == "year" and len(raw_qty) == 4 and raw_qty.isdigit():
+            continue
+        if _REFERENCE_PREFIX_RE.search(line, 0, match.start()):
+            continue
+        quantity = _to_float(raw_qty)
+        unit = unit_name
+        break
+
+    label = _QTY_LABEL_RE.search(line)
+    if label:
+        raw_unit = (label.group("unit") or "").lower()
+        label_unit = _UNIT_ALIASES.get(raw_unit, raw_unit) or None
+        return _to_float(label.group("qty")), label_unit, True
+    return quantity, unit, False
+
+
+def guess_quantity_unit(line: str) -> Tuple[Optional[float], Optional[str]]:
+    """
+    Pull a rough quantity / unit pair out of a pricing line.
+
+    An explicit "qty: 12" / "No. of guards: 6" label wins for the quantity,
+    with a unit only if one directly follows it; otherwise the first number
+    directly followed by a known unit is used. Four‑digit years and
+    numbers following "section", "clause", etc. are not quantities.
+    """
+    quantity, unit, _ = _guess(line)
+    return quantity, unit
+
+
+def _new_item(line: str, key: str, order: int) -> dict:
+    description = _WS_RE.sub(" ", line).strip()
+    quantity, unit, labelled = _guess(description)
+    return {
+        "raw_line": description,
+        "description_guess": description[:120],
+        "quantity_guess": quantity,
+        "unit_guess": unit,
+        "occurrences": 0,
+        "_key": key,
+        "_order": order,
+        "_labelled": labelled,
+    }
+
+
+def _score(item: dict) -> int:
+    # An explicit "qty:" label is the strongest signal; a bare number + unit
+    # can still be a stray reference, so it counts for less.
+    score = item["occurrences"]
+    if item["_labelled"]:
+        score += 4
+    elif item["quantity_guess"] is not None:
+        score += 2
+    if item["unit_guess"] is not None:
+        score += 1
+    return score
+
+
+def _finalise(index: Dict[str, dict]) -> List[dict]:
+    ranked = sorted(index.values(), key=lambda it: (-_score(it), it["_order"]))
+    out = []
+    for it in ranked:
+        item = {k: v for k, v in it.items() if not k.startswith("_")}
+        out.append(item)
+    return out
+
+
+def collect_pricing_items(lines: Iterable[str], min_length: int = 20) -> List[dict]:
+    """
+    Turn candidate lines into deduplicated, ranked pricing items.
+
+    Lines are keyed on their normalised description so the same row seen in
+    several overlapping snippets is reported once, with an ``occurrences``
+    count. Items with a recognisable quantity/unit rank first; ties keep
+    document order.
+    """
+    index: Dict[str, dict] = {}
+    for line in lines:
+        stripped = line.strip()
+        if len(stripped) <= min_length or not any(ch.isdigit() for ch in stripped):
+            continue
+
+        key = normalise_description(stripped)
+        if not key:
+            continue
+
+        item = index.get(key)
+        if item is None:
+            item = index[key] = _new_item(stripped, key, len(index))
+        item["occurrences"] += 1
+
+    return _finalise(index)
+
+
+def merge_pricing_items(*item_lists: Iterable[dict]) -> List[dict]:
+    """
+    Merge pricing item lists (e.g. from several tender documents) into one.
+
+    Items sharing a normalised description are combined: occurrences are
+    summed and missing quantity/unit guesses are filled from later lists.
+    """
+    index: Dict[str, dict] = {}
+    for items in item_lists:
+        for it in items:
+            raw_line = it.get("raw_line") or it.get("description_guess") or ""
+            key = normalise_description(raw_line)
+            if not key:
+                continue
+
+            merged = index.get(key)
+            if merged is None:
+                merged = index[key] = _new_item(raw_line, key, len(index))
+                merged.update({k: v for k, v in it.items() if k not in merged})
+                for field in ("quantity_guess", "unit_guess"):
+                    if merged[field] is None and it.get(field) is not None:
+                        merged[field] = it[field]
+                merged["occurrences"] = int(it.get("occurrences", 1) or 1)
+                continue
+
+            merged["occurrences"] += int(it.get("occurrences", 1) or 1)
+            for field in ("quantity_guess", "unit_guess"):
+                if merged.get(field) is None and it.get(field) is not None:
+                    merged[field] = it[field]
+
+    return _finalise(index)
@@ -0,0 +1,179 @@
+import math
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# A compiled rule: (label, matcher(item) -> bool, op(value) -> value)
+CompiledRule = Tuple[str, Callable[[dict], bool], Callable[[float], float]]
+
+# Default stage per rule type: "base" rules adjust the cost rate before
+# markup, "rate" rules the marked‑up selling rate. A rule may override this
+# with an explicit "stage" key.
+DEFAULT_STAGES = {
+    "escalation": "base",
+    "min_rate": "base",
+    "discount": "rate",
+    "max_rate": "rate",
+    "rounding": "rate",
+}
+STAGES = ("base", "rate")
+ROUNDING_MODES = ("nearest", "up", "down")
+
+
+def _number(rule: dict, key: str) -> Optional[float]:
+    try:
+        value = float(rule[key])
+    except (KeyError, TypeError, ValueError):
+        return None
+    return value if math.isfinite(value) else None
+
+
+def _compile_matcher(rule: dict) -> Callable[[dict], bool]:
+    category = str(rule.get("category") or "").strip().lower()
+    unit = str(rule.get("unit") or "").strip().lower()
+    keyword = str(rule.get("match") or "").strip().lower()
+
+    if not (category or unit or keyword):
+        return lambda item: True
+
+    def matcher(item: dict) -> bool:
+        if category and str(item.get("category") or "").strip().lower() != category:
+            return False
+        if unit and str(item.get("unit") or "").strip().lower() != unit:
+            return False
+        if keyword and keyword not in str(item.get("description") or "").lower():
+            return False
+        return True
+
+    return matcher
+
+
+def _compile_rounding(step: float, mode: str) -> Callable[[float], float]:
+    # Snap to the step's own precision so 0.3 stays 0.3, not 0.30000000000000004.
+    decimals = max(0, -Decimal(str(step)).as_tuple().exponent)
+    if mode == "up":
+        to_step = math.ceil
+    elif mode == "down":
+        to_step = math.floor
+    else:
+        # Half‑up: a tender price must never round an exact tie down.
+        to_step = lambda q: math.floor(q + 0.5)  # noqa: E731
+    return lambda v: round(to_step(round(v / step, 9)) * step, decimals)
+
+
+def _compile_op(rule: dict) -> Callable[[float], float]:
+    """Build the operation for ``rule``; raise ValueError if it is invalid."""
+    kind = rule["type"]
+
+    if kind == "escalation":
+        percent = _number(rule, "percent")
+        years = _number(rule, "years") if "years" in rule else 1.0
+        if percent is None or percent <= -100:
+            raise ValueError("escalation needs a finite 'percent' above -100")
+        if years is None or years < 0:
+            raise ValueError("escalation 'years' must be a finite number >= 0")
+        factor = (1 + percent / 100.0) ** years
+        return lambda v: v * factor
+
+    if kind == "discount":
+        percent = _number(rule, "percent")
+        if percent is None or not 0 <= percent <= 100:
+            raise ValueError("discount needs a 'percent' between 0 and 100")
+        factor = 1 - percent / 100.0
+        return lambda v: v * factor
+
+    if kind in ("min_rate", "max_rate"):
+        limit = _number(rule, "value")
+        if limit is None or limit < 0:
+            raise ValueError(f"{kind} needs a finite 'value' >= 0")
+        if kind == "min_rate":
+            return lambda v: max(v, limit)
+        return lambda v: min(v, limit)
+
+    # rounding
+    step = _number(rule, "step") if "step" in rule else 0.01
+    mode = rule.get("mode", "nearest")
+    if step is None or step <= 0:
+        raise ValueError("rounding 'step' must be a finite number > 0")
+    if mode not in ROUNDING_MODES:
+        raise ValueError(f"rounding 'mode' must be one of {', '.join(ROUNDING_MODES)}")
+    return _compile_rounding(step, mode)
+
+
+def compile_pricing_rules(
+    rules: Any, skipped: Optional[List[dict]] = None
+) -> Dict[str, List[CompiledRule]]:
+    """
+    Compile declarative pricing rules into per‑stage operations.
+
+    Each rule is a dict with a ``type`` plus optional ``category`` / ``unit``
+    / ``match`` (description keyword) filters:
+
+        {"type": "escalation", "percent": 6.5, "years": 2}
+        {"type": "discount", "percent": 5, "category": "equipment"}
+        {"type": "min_rate", "value": 28.79, "unit": "hour"}
+        {"type": "max_rate", "value": 25000, "unit": "guard/month"}
+        {"type": "rounding", "step": 0.5, "mode": "up"}
+
+    Escalation and min_rate default to the "base" stage (cost rate, before
+    markup); discount, max_rate and rounding default to the "rate" stage
+    (marked‑up rate). Set ``"stage": "base"`` or ``"rate"`` to override.
+    All base rules run before all rate rules; within a stage, list order
+    is kept.
+
+    Rules are compiled once per calculation so the item loop only runs
+    pre‑built closures. A single rule dict is accepted in place of a list.
+    Unknown, incomplete or out‑of‑range rules (negative values, discounts
+    outside 0–100, non‑positive rounding steps, unknown rounding modes,
+    NaN/inf) are skipped and, if ``skipped`` is given, appended to it as
+    ``{"rule": ..., "reason": ...}``.
+    """
+    if skipped is None:
+        skipped = []
+
+    if isinstance(rules, dict):
+        rules = [rules]
+    elif not isinstance(rules, (list, tuple)):
+        if rules not in (None, "", []):
+            skipped.append(
+                {"rule": rules, "reason": "pricing_rules must be a list of rule objects"}
+            )
+        rules = []
+
+    compiled: Dict[str, List[CompiledRule]] = {stage: [] for stage in STAGES}
+    for rule in rules:
+        if not isinstance(rule, dict):
+            skipped.append({"rule": rule, "reason": "rule must be an object"})
+            continue
+
+        kind = rule.get("type")
+        if not isinstance(kind, str) or kind not in DEFAULT_STAGES:
+            reason = f"unknown rule type; expected one of {', '.join(DEFAULT_STAGES)}"
+            skipped.append({"rule": rule, "reason": reason})
+            continue
+
+        stage = rule.get("stage") or DEFAULT_STAGES[kind]
+        if not isinstance(stage, str) or stage not in STAGES:
+            skipped.append({"rule": rule, "reason": "'stage' must be 'base' or 'rate'"})
+            continue
+
+        try:
+            op = _compile_op(rule)
+        except ValueError as exc:
+            skipped.append({"rule": rule, "reason": str(exc)})
+            continue
+
+        label = str(rule.get("name") or kind)
+        compiled[stage].append((label, _compile_matcher(rule), op))
+    return compiled
+
+
+def apply_pricing_rules(
+    stage_rules: List[CompiledRule], item: Dict[str, Any], value: float, applied: List[str]
+) -> float:
+    """Run one stage of compiled rules over ``value`` for ``item``, in order."""
+    for label, matcher, op in stage_rules:
+        if matcher(item):
+            value = op(value)
+            applied.append(label)
+    return value